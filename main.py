@@ -3,12 +3,23 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
 import json
+import os
+import struct
 import time
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, Any
+from enum import Enum, IntEnum
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union, Any
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json produces the same document, just slower
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Constants — unique names, not reused from other contracts
@@ -44,12 +55,28 @@ class MangoTangoEvent(Enum):
     ROYALTY_PAID = "RoyaltyPaid"
 
 
-class MangoTangoPhase(Enum):
+# Field names for each event payload; the log stores only these shared key tuples and the values.
+_EVENT_KEYS_COUNT = ("count",)
+_EVENT_KEYS_REMOVED = ("removed",)
+_EVENT_KEYS_MINT = ("tokenId", "to", "valueWei")
+_EVENT_KEYS_TOKEN = ("tokenId",)
+_EVENT_KEYS_PHASE = ("phase",)
+
+
+class MangoTangoPhase(IntEnum):
     CLOSED = 0
     ALLOWLIST = 1
     PUBLIC = 2
     SOLD_OUT = 3
 
+    __str__ = Enum.__str__  # keep "MangoTangoPhase.PUBLIC" rather than IntEnum's bare "2"
+
+
+# Plain-int phase values for the minter's hot predicates; MangoTangoPhase is an IntEnum, so these are int compares.
+_PHASE_CLOSED = int(MangoTangoPhase.CLOSED)
+_PHASE_ALLOWLIST = int(MangoTangoPhase.ALLOWLIST)
+_PHASE_SOLD_OUT = int(MangoTangoPhase.SOLD_OUT)
+
 
 # ---------------------------------------------------------------------------
 # Exceptions — unique names
@@ -57,44 +84,76 @@ class MangoTangoPhase(Enum):
 
 class MangoTangoMintCapReachedError(Exception):
     def __init__(self, current: int, cap: int) -> None:
-        super().__init__(f"MangoTango: mint cap reached (current={current}, cap={cap})")
+        super().__init__(current, cap)
+        self.current = current
+        self.cap = cap
+
+    def __str__(self) -> str:
+        return f"MangoTango: mint cap reached (current={self.current}, cap={self.cap})"
 
 
 class MangoTangoNotAllowedError(Exception):
     def __init__(self, address: str) -> None:
-        super().__init__(f"MangoTango: address not on allowlist: {address}")
+        super().__init__(address)
+        self.address = address
+
+    def __str__(self) -> str:
+        return f"MangoTango: address not on allowlist: {self.address}"
 
 
 class MangoTangoInvalidTokenIdError(Exception):
     def __init__(self, token_id: int) -> None:
-        super().__init__(f"MangoTango: invalid token id: {token_id}")
+        super().__init__(token_id)
+        self.token_id = token_id
+
+    def __str__(self) -> str:
+        return f"MangoTango: invalid token id: {self.token_id}"
 
 
 class MangoTangoPhaseClosedError(Exception):
     def __init__(self, phase: MangoTangoPhase) -> None:
-        super().__init__(f"MangoTango: phase not open for minting: {phase}")
+        super().__init__(phase)
+        self.phase = phase
+
+    def __str__(self) -> str:
+        return f"MangoTango: phase not open for minting: {self.phase}"
 
 
 class MangoTangoWalletLimitError(Exception):
     def __init__(self, address: str, count: int, limit: int) -> None:
-        super().__init__(f"MangoTango: wallet limit exceeded for {address} (count={count}, limit={limit})")
+        super().__init__(address, count, limit)
+        self.address = address
+        self.count = count
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return f"MangoTango: wallet limit exceeded for {self.address} (count={self.count}, limit={self.limit})"
 
 
 class MangoTangoInsufficientValueError(Exception):
     def __init__(self, sent: int, required: int) -> None:
-        super().__init__(f"MangoTango: insufficient value (sent={sent}, required={required})")
+        super().__init__(sent, required)
+        self.sent = sent
+        self.required = required
+
+    def __str__(self) -> str:
+        return f"MangoTango: insufficient value (sent={self.sent}, required={self.required})"
 
 
 class MangoTangoRevealNotReadyError(Exception):
     def __init__(self, token_id: int) -> None:
-        super().__init__(f"MangoTango: reveal not ready for token {token_id}")
+        super().__init__(token_id)
+        self.token_id = token_id
+
+    def __str__(self) -> str:
+        return f"MangoTango: reveal not ready for token {self.token_id}"
 
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RoyaltyInfo:
     recipient: str
     bps: int
@@ -103,28 +162,50 @@ class RoyaltyInfo:
         return {"recipient": self.recipient, "bps": self.bps}
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenMetadata:
     token_id: int
     name: str
     description: str
     image_uri: str
-    attributes: List[Dict[str, Any]]
+    attributes: Tuple[Tuple[int, int], ...]  # (trait_type_id, value_id); see resolved_attributes
     revealed: bool
     revealed_at: Optional[float] = None
 
-    def to_json(self) -> str:
-        return json.dumps({
+    @property
+    def resolved_attributes(self) -> List[Dict[str, Any]]:
+        return _resolve_attributes(self.attributes)
+
+    def _json_payload(self) -> Dict[str, Any]:
+        return {
             "token_id": self.token_id,
             "name": self.name,
             "description": self.description,
             "image": self.image_uri,
-            "attributes": self.attributes,
+            "attributes": self.resolved_attributes,
             "revealed": self.revealed,
-        }, indent=2)
-
+        }
 
-@dataclass
+    def to_json(self) -> str:
+        payload = self._json_payload()
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:  # orjson rejects ints beyond 64 bits; json handles any token id
+                pass
+        return json.dumps(payload, indent=2)
+
+    def to_json_bytes(self) -> bytes:
+        payload = self._json_payload()
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        return json.dumps(payload, indent=2).encode()
+
+
+@dataclass(slots=True)
 class MintRule:
     phase: MangoTangoPhase
     max_per_wallet: int
@@ -132,110 +213,366 @@ class MintRule:
     active: bool = True
 
 
+# Indexed by int(phase); None for phases that do not accept mints.
+_MINT_RULES_BY_PHASE: Tuple[Optional[MintRule], ...] = (
+    None,
+    MintRule(MangoTangoPhase.ALLOWLIST, MANGO_TANGO_ALLOWLIST_PHASE_MAX_PER_WALLET, MANGO_TANGO_MINT_PRICE_WEI),
+    MintRule(MangoTangoPhase.PUBLIC, MANGO_TANGO_PUBLIC_PHASE_MAX_PER_WALLET, MANGO_TANGO_MINT_PRICE_WEI),
+    None,
+)
+_MAX_PER_WALLET_BY_PHASE: Tuple[int, ...] = tuple(
+    rule.max_per_wallet if rule is not None else 0 for rule in _MINT_RULES_BY_PHASE
+)
+
+
 # ---------------------------------------------------------------------------
 # Trait tables for metadata generation (expand line count and variety)
 # ---------------------------------------------------------------------------
 
-MANGO_TANGO_BACKGROUNDS = [
+MANGO_TANGO_BACKGROUNDS = (
     "Tropical Sunset", "Coral Reef", "Golden Hour", "Mango Grove", "Tango Night",
     "Citrus Blush", "Amber Glow", "Saffron Mist", "Peach Haze", "Palm Shadow",
     "Jungle Canopy", "Beach Dawn", "Harvest Moon", "Spice Market", "Rum Barrel",
-]
+)
 
-MANGO_TANGO_SKIN_TONES = [
+MANGO_TANGO_SKIN_TONES = (
     "Sun Kissed", "Golden Ripe", "Amber", "Honey", "Caramel",
     "Blush", "Coral", "Peach", "Cream", "Light Amber",
-]
+)
 
-MANGO_TANGO_EXPRESSIONS = [
+MANGO_TANGO_EXPRESSIONS = (
     "Cheerful", "Wink", "Smirk", "Joy", "Serene",
     "Playful", "Mysterious", "Bold", "Calm", "Zesty",
-]
+)
 
-MANGO_TANGO_ACCESSORIES = [
+MANGO_TANGO_ACCESSORIES = (
     "None", "Leaf Crown", "Sunglasses", "Bandana", "Straw Hat",
     "Flower", "Scarf", "Bow Tie", "Earring", "Necklace",
     "Headband", "Cap", "Beret", "Pin", "Chain",
-]
+)
 
-MANGO_TANGO_RARITY_TIERS = [
+MANGO_TANGO_RARITY_TIERS = (
     "Common", "Uncommon", "Rare", "Epic", "Legendary",
-]
+)
 
-MANGO_TANGO_BACKGROUND_HEX = [
+MANGO_TANGO_BACKGROUND_HEX = (
     "#FF6B35", "#F7C35F", "#2D5A27", "#8B4513", "#FF8C00",
     "#CD853F", "#D2691E", "#DEB887", "#F4A460", "#BC8F8F",
-]
+)
 
-MANGO_TANGO_SPECIAL_TRAITS = [
+MANGO_TANGO_SPECIAL_TRAITS = (
     "Golden Seed", "Tango Dancer", "Mango King", "Tropical Royalty",
     "Sun Blessed", "Harvest Lord", "Citrus Spirit", "Island Soul",
-]
+)
 
+# Table sizes hoisted out of the pickers; the tables above are tuples so these cannot drift.
+_BG_N = len(MANGO_TANGO_BACKGROUNDS)
+_SKIN_N = len(MANGO_TANGO_SKIN_TONES)
+_EXPRESSION_N = len(MANGO_TANGO_EXPRESSIONS)
+_ACCESSORY_N = len(MANGO_TANGO_ACCESSORIES)
+_RARITY_N = len(MANGO_TANGO_RARITY_TIERS)
+_BG_HEX_N = len(MANGO_TANGO_BACKGROUND_HEX)
+_SPECIAL_N = len(MANGO_TANGO_SPECIAL_TRAITS)
 
-def _hash_seed_for_token(collection_seed: str, token_id: int, nonce: int = 0) -> str:
-    payload = f"{collection_seed}-{token_id}-{nonce}"
-    return hashlib.sha256(payload.encode()).hexdigest()
 
+_SEED_PAYLOAD = struct.Struct(">II")
+_SEED_PAYLOAD_MAX = 0xFFFFFFFF
+# Payload prefix for ids or nonces outside uint32; at least 11 bytes in total, so never equal to an 8-byte packed payload.
+_WIDE_SEED_PREFIX = b"\xffwide-id"
 
-def _pick_trait_from_hash(h: str, traits: List[str]) -> str:
-    idx = int(h[:8], 16) % len(traits)
-    return traits[idx]
 
+@functools.lru_cache(maxsize=8)
+def _seed_hasher(collection_seed: str) -> Any:
+    # BLAKE2b state with the key block already absorbed; callers .copy() it instead of re-keying per hash.
+    return hashlib.blake2b(key=hashlib.sha256(collection_seed.encode()).digest(), digest_size=32)
 
-def _pick_hex_from_hash(h: str, hexes: List[str]) -> str:
-    idx = int(h[8:16], 16) % len(hexes)
-    return hexes[idx]
 
+def _hash_seed_for_token(collection_seed: str, token_id: int, nonce: int = 0) -> bytes:
+    # Off-chain trait derivation only: keyed BLAKE2b over packed ints, no payload string to format or encode.
+    h = _seed_hasher(collection_seed).copy()
+    if 0 <= token_id <= _SEED_PAYLOAD_MAX and 0 <= nonce <= _SEED_PAYLOAD_MAX:
+        h.update(_SEED_PAYLOAD.pack(token_id, nonce))
+    else:
+        h.update(_WIDE_SEED_PREFIX + f"{token_id}-{nonce}".encode())
+    return h.digest()
+
+
+def _precompute_all_seeds(first: int, last: int) -> List[bytes]:
+    # Seeds for token ids first..last in order; same values as _token_seed, without the per-call cache overhead.
+    copy, pack = _seed_hasher(MANGO_TANGO_COLLECTION_SEED).copy, _SEED_PAYLOAD.pack
+    digests: List[bytes] = []
+    append = digests.append
+    for token_id in range(first, last + 1):
+        h = copy()
+        h.update(pack(token_id, 0))
+        append(h.digest())
+    return digests
+
+
+@functools.lru_cache(maxsize=MANGO_TANGO_MAX_SUPPLY + 1)
+def _token_seed(token_id: int, nonce: int = 0) -> bytes:
+    # Every trait helper derives from the module collection seed, so the cache is keyed on the token alone.
+    return _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id, nonce)
+
+
+def _pick_trait(digest: bytes, offset: int, traits: Tuple[str, ...], n: int) -> str:
+    return traits[int.from_bytes(digest[offset:offset + 4], "big") % n]
+
+
+# (trait_type, digest byte offset, value table, table size) for the base traits, in output order.
+_BASE_TRAIT_LAYOUT = (
+    ("Background", 0, MANGO_TANGO_BACKGROUNDS, _BG_N),
+    ("Skin", 1, MANGO_TANGO_SKIN_TONES, _SKIN_N),
+    ("Expression", 2, MANGO_TANGO_EXPRESSIONS, _EXPRESSION_N),
+    ("Accessory", 3, MANGO_TANGO_ACCESSORIES, _ACCESSORY_N),
+    ("Rarity", 5, MANGO_TANGO_RARITY_TIERS, _RARITY_N),
+    ("Background Color", 10, MANGO_TANGO_BACKGROUND_HEX, _BG_HEX_N),
+)
+_SPECIAL_FLAG_OFFSET = 7
+_SPECIAL_TRAIT_OFFSET = 8
+
+
+def _compile_pick_indices() -> Callable[[bytes], Tuple[int, ...]]:
+    # Value indices in _BASE_TRAIT_LAYOUT order, the Special index, then a 0/1 has-special flag.
+    # Offsets and table sizes are literals in the generated source; Special is always computed and the flag
+    # decides whether it is emitted, so there is no branch.
+    # The digest prefix is decoded into one int up front and every 4-byte window is a shift and mask of it.
+    offsets = [o for _, o, _, _ in _BASE_TRAIT_LAYOUT] + [_SPECIAL_TRAIT_OFFSET]
+    span = max(offsets) + 4
+
+    def word(o: int) -> str:
+        return f"((w >> {8 * (span - o - 4)}) & 0xFFFFFFFF)"
+
+    terms = [f"{word(o)} % {n}" for _, o, _, n in _BASE_TRAIT_LAYOUT]
+    terms.append(f"{word(_SPECIAL_TRAIT_OFFSET)} % {_SPECIAL_N}")
+    terms.append(f"int(d[{_SPECIAL_FLAG_OFFSET}] % 5 == 0)")
+    src = (
+        "def _pick_indices_specialized(d, from_bytes=int.from_bytes):\n"
+        f"    w = from_bytes(d[:{span}], 'big')\n"
+        "    return (\n" + "".join(f"        {t},\n" for t in terms) + "    )\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, "<mangotango:_pick_indices>", "exec"), namespace)
+    return namespace["_pick_indices_specialized"]
 
-def generate_metadata_attributes(token_id: int, revealed: bool) -> List[Dict[str, Any]]:
-    seed = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    attrs = []
-    attrs.append({"trait_type": "Background", "value": _pick_trait_from_hash(seed[0:16], MANGO_TANGO_BACKGROUNDS)})
-    attrs.append({"trait_type": "Skin", "value": _pick_trait_from_hash(seed[2:18], MANGO_TANGO_SKIN_TONES)})
-    attrs.append({"trait_type": "Expression", "value": _pick_trait_from_hash(seed[4:20], MANGO_TANGO_EXPRESSIONS)})
-    attrs.append({"trait_type": "Accessory", "value": _pick_trait_from_hash(seed[6:22], MANGO_TANGO_ACCESSORIES)})
-    attrs.append({"trait_type": "Rarity", "value": _pick_trait_from_hash(seed[10:26], MANGO_TANGO_RARITY_TIERS)})
-    attrs.append({"trait_type": "Background Color", "value": _pick_hex_from_hash(seed[12:28], MANGO_TANGO_BACKGROUND_HEX)})
-    if int(seed[14:16], 16) % 5 == 0:
-        attrs.append({"trait_type": "Special", "value": _pick_trait_from_hash(seed[16:32], MANGO_TANGO_SPECIAL_TRAITS)})
-    return attrs
 
+# Built once at import from the frozen trait tables above.
+_pick_indices_compiled = _compile_pick_indices()
 
-def build_token_metadata(token_id: int, revealed: bool) -> TokenMetadata:
-    attrs = generate_metadata_attributes(token_id, revealed)
-    name = f"{MANGO_TANGO_NAME} #{token_id}"
-    desc = f"A unique MangoTango collectible. Token ID {token_id}. Part of the {MANGO_TANGO_NAME} collection."
-    if revealed:
-        image_uri = f"{MANGO_TANGO_COLLECTION_URI}{token_id}.png"
+
+# Attribute ids are (trait_type_id, value_id) pairs into these two parallel tuples.
+_TRAIT_TYPE_NAMES = tuple(trait_type for trait_type, _, _, _ in _BASE_TRAIT_LAYOUT) + ("Special",)
+_TRAIT_VALUE_TABLES = tuple(table for _, _, table, _ in _BASE_TRAIT_LAYOUT) + (MANGO_TANGO_SPECIAL_TRAITS,)
+_SPECIAL_TRAIT_TYPE_ID = len(_BASE_TRAIT_LAYOUT)
+_HAS_SPECIAL_SLOT = _SPECIAL_TRAIT_TYPE_ID + 1
+_TRAIT_TYPE_IDS = {name: type_id for type_id, name in enumerate(_TRAIT_TYPE_NAMES)}
+_TRAIT_VALUE_IDS = tuple({value: value_id for value_id, value in enumerate(table)} for table in _TRAIT_VALUE_TABLES)
+# One shared pair object per (trait_type_id, value_id); every token's attributes point into this table.
+_INTERNED_ATTRIBUTE_IDS = tuple(
+    tuple((type_id, value_id) for value_id in range(len(table))) for type_id, table in enumerate(_TRAIT_VALUE_TABLES)
+)
+
+
+def _ids_from_indices(indices: Tuple[int, ...]) -> Tuple[Tuple[int, int], ...]:
+    # The has-special flag (0 or 1) widens the slice to include the Special slot.
+    return tuple(map(tuple.__getitem__, _INTERNED_ATTRIBUTE_IDS, indices[:_SPECIAL_TRAIT_TYPE_ID + indices[_HAS_SPECIAL_SLOT]]))
+
+
+def _resolve_attributes(attribute_ids: Tuple[Tuple[int, int], ...]) -> List[Dict[str, Any]]:
+    return [
+        {"trait_type": _TRAIT_TYPE_NAMES[type_id], "value": _TRAIT_VALUE_TABLES[type_id][value_id]}
+        for type_id, value_id in attribute_ids
+    ]
+
+
+@functools.lru_cache(maxsize=MANGO_TANGO_MAX_SUPPLY + 1)
+def _metadata_attribute_ids(token_id: int) -> Tuple[Tuple[int, int], ...]:
+    return _ids_from_indices(_pick_indices_compiled(_token_seed(token_id)))
+
+
+_UNREVEALED_URI = f"{MANGO_TANGO_COLLECTION_URI}unrevealed.png"
+
+# Display strings for every token id 0..MANGO_TANGO_MAX_SUPPLY; a few ms at import, no hashing involved.
+_TOKEN_NAMES = tuple(f"{MANGO_TANGO_NAME} #{tid}" for tid in range(MANGO_TANGO_MAX_SUPPLY + 1))
+_TOKEN_DESCRIPTIONS = tuple(
+    f"A unique MangoTango collectible. Token ID {tid}. Part of the {MANGO_TANGO_NAME} collection."
+    for tid in range(MANGO_TANGO_MAX_SUPPLY + 1)
+)
+_REVEALED_URIS = tuple(f"{MANGO_TANGO_COLLECTION_URI}{tid}.png" for tid in range(MANGO_TANGO_MAX_SUPPLY + 1))
+
+# Trait tables for every token id 0..MANGO_TANGO_MAX_SUPPLY, filled by _warm_metadata().
+# Attribute id tuples are shared by every TokenMetadata built for that token and must not be mutated.
+_PRECOMPUTED_INDICES: Optional[Tuple[Tuple[int, ...], ...]] = None
+_PRECOMPUTED_ATTRIBUTES: Optional[Tuple[Tuple[Tuple[int, int], ...], ...]] = None
+
+
+def _warm_metadata() -> None:
+    global _PRECOMPUTED_INDICES, _PRECOMPUTED_ATTRIBUTES
+    if _PRECOMPUTED_ATTRIBUTES is None:
+        seeds = _precompute_all_seeds(0, MANGO_TANGO_MAX_SUPPLY)
+        _PRECOMPUTED_INDICES = tuple(map(_pick_indices_compiled, seeds))
+        _PRECOMPUTED_ATTRIBUTES = tuple(_ids_from_indices(indices) for indices in _PRECOMPUTED_INDICES)
+
+
+def _token_trait_indices(token_id: int) -> Tuple[int, ...]:
+    table = _PRECOMPUTED_INDICES
+    if table is not None and 0 <= token_id < len(table):
+        return table[token_id]
+    return _pick_indices_compiled(_token_seed(token_id))
+
+
+def _token_attribute_ids(token_id: int) -> Tuple[Tuple[int, int], ...]:
+    table = _PRECOMPUTED_ATTRIBUTES
+    if table is not None and 0 <= token_id < len(table):
+        return table[token_id]
+    return _metadata_attribute_ids(token_id)
+
+
+def generate_metadata_attributes(token_id: int, revealed: bool) -> List[Dict[str, Any]]:
+    # Fresh dicts on every call: generate_extended_attributes appends to the returned list.
+    return _resolve_attributes(_token_attribute_ids(token_id))
+
+
+def generate_all_attributes(n: int = MANGO_TANGO_MAX_SUPPLY) -> Dict[str, List[Optional[str]]]:
+    # Column-wise base traits for token ids 1..n (index i is token i + 1); "Special" is None where absent.
+    seeds = _precompute_all_seeds(1, n)
+    from_bytes = int.from_bytes
+    columns: Dict[str, List[Optional[str]]] = {}
+    for trait_type, offset, table, size in _BASE_TRAIT_LAYOUT:
+        end = offset + 4
+        columns[trait_type] = [table[from_bytes(d[offset:end], "big") % size] for d in seeds]
+    special = MANGO_TANGO_SPECIAL_TRAITS
+    start, end, size = _SPECIAL_TRAIT_OFFSET, _SPECIAL_TRAIT_OFFSET + 4, _SPECIAL_N
+    columns["Special"] = [
+        special[from_bytes(d[start:end], "big") % size] if d[_SPECIAL_FLAG_OFFSET] % 5 == 0 else None
+        for d in seeds
+    ]
+    return columns
+
+
+def reset_metadata_caches() -> None:
+    # Call after rotating MANGO_TANGO_COLLECTION_SEED so cached seeds and traits are recomputed.
+    # Trait tables and their layout are fixed at import and are not re-read here.
+    global _PRECOMPUTED_INDICES, _PRECOMPUTED_ATTRIBUTES
+    _token_seed.cache_clear()
+    _metadata_attribute_ids.cache_clear()
+    _rarity_score_tables.cache_clear()
+    _PRECOMPUTED_INDICES = None
+    _PRECOMPUTED_ATTRIBUTES = None
+
+
+if os.environ.get("MANGOTANGO_PREWARM") == "1":
+    _warm_metadata()
+
+
+def _assemble_token_metadata(token_id: int, attribute_ids: Tuple[Tuple[int, int], ...], revealed: bool, revealed_at: Optional[float]) -> TokenMetadata:
+    if 0 <= token_id <= MANGO_TANGO_MAX_SUPPLY:
+        name = _TOKEN_NAMES[token_id]
+        desc = _TOKEN_DESCRIPTIONS[token_id]
+        image_uri = _REVEALED_URIS[token_id] if revealed else _UNREVEALED_URI
     else:
-        image_uri = f"{MANGO_TANGO_COLLECTION_URI}unrevealed.png"
+        name = f"{MANGO_TANGO_NAME} #{token_id}"
+        desc = f"A unique MangoTango collectible. Token ID {token_id}. Part of the {MANGO_TANGO_NAME} collection."
+        image_uri = f"{MANGO_TANGO_COLLECTION_URI}{token_id}.png" if revealed else _UNREVEALED_URI
     return TokenMetadata(
         token_id=token_id,
         name=name,
         description=desc,
         image_uri=image_uri,
-        attributes=attrs,
+        attributes=attribute_ids,
         revealed=revealed,
-        revealed_at=time.time() if revealed else None,
+        revealed_at=revealed_at,
     )
 
 
+def build_token_metadata(token_id: int, revealed: bool) -> TokenMetadata:
+    return _assemble_token_metadata(token_id, _token_attribute_ids(token_id), revealed, time.time() if revealed else None)
+
+
+# ---------------------------------------------------------------------------
+# Collection storage (per-token columns, materialized on demand)
+# ---------------------------------------------------------------------------
+
+_TRAIT_INDEX_WIDTH = len(_BASE_TRAIT_LAYOUT) + 1
+
+
+class MangoTangoCollection:
+    # Parallel columns indexed by token id (slot 0 unused); TokenMetadata is only built at the API boundary.
+    def __init__(self) -> None:
+        self._present = bytearray(1)
+        self._revealed = bytearray(1)
+        self._revealed_at = array("d", [0.0])
+        self._trait_indices = array("b", bytes(_TRAIT_INDEX_WIDTH))
+        self._has_special = bytearray(1)
+        self._count = 0
+
+    def __contains__(self, token_id: object) -> bool:
+        return isinstance(token_id, int) and 0 < token_id < len(self._present) and self._present[token_id] == 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, token_id: int) -> None:
+        grow = token_id + 1 - len(self._present)
+        if grow > 0:
+            self._present.extend(bytes(grow))
+            self._revealed.extend(bytes(grow))
+            self._revealed_at.extend([0.0] * grow)
+            self._trait_indices.extend(bytes(grow * _TRAIT_INDEX_WIDTH))
+            self._has_special.extend(bytes(grow))
+        if not self._present[token_id]:
+            self._count += 1
+        self._present[token_id] = 1
+        self._revealed[token_id] = 0
+        self._revealed_at[token_id] = 0.0
+        indices = _token_trait_indices(token_id)
+        start = token_id * _TRAIT_INDEX_WIDTH
+        self._trait_indices[start:start + _TRAIT_INDEX_WIDTH] = array("b", indices[:_TRAIT_INDEX_WIDTH])
+        self._has_special[token_id] = indices[_HAS_SPECIAL_SLOT]
+
+    def is_revealed(self, token_id: int) -> bool:
+        return token_id in self and self._revealed[token_id] == 1
+
+    def mark_revealed(self, token_id: int, at: float) -> None:
+        self._revealed[token_id] = 1
+        self._revealed_at[token_id] = at
+
+    def trait_indices(self, token_id: int) -> Tuple[int, ...]:
+        # Same layout as _pick_indices_compiled: value indices followed by the has-special flag.
+        start = token_id * _TRAIT_INDEX_WIDTH
+        return tuple(self._trait_indices[start:start + _TRAIT_INDEX_WIDTH]) + (self._has_special[token_id],)
+
+    def to_metadata(self, token_id: int) -> TokenMetadata:
+        revealed = self._revealed[token_id] == 1
+        attribute_ids = _ids_from_indices(self.trait_indices(token_id))
+        return _assemble_token_metadata(token_id, attribute_ids, revealed, self._revealed_at[token_id] if revealed else None)
+
+
 # ---------------------------------------------------------------------------
 # MangoTango Minter (core contract logic)
 # ---------------------------------------------------------------------------
 
+def _norm(address: str) -> str:
+    return address.strip().lower()
+
+
 class MangoTangoMinter:
     def __init__(self) -> None:
+        _warm_metadata()  # one-time per process; mints then index precomputed traits instead of hashing
         self._next_token_id = 1
         self._total_minted = 0
+        self._fingerprint_cache: Optional[str] = None  # cleared by mint(), the only writer of the two counters above
         self._allowlist: Set[str] = set()
         self._mint_count_per_wallet: Dict[str, int] = {}
         self._phase = MangoTangoPhase.ALLOWLIST
-        self._metadata_store: Dict[int, TokenMetadata] = {}
+        self._collection = MangoTangoCollection()
         self._owner_of: Dict[int, str] = {}
+        self._tokens_by_owner: Dict[str, Set[int]] = {}  # normalized address -> owned token ids
+        self._tokens_tuple_cache: Dict[str, Tuple[int, ...]] = {}  # sorted view of _tokens_by_owner; mint() drops stale keys
         self._reveal_ready_at: Dict[int, float] = {}
-        self._event_log: List[Tuple[MangoTangoEvent, Dict[str, Any]]] = []
+        # Heap of (ready_at, token_id) not yet swept; _reveal_ready_at is authoritative and entries are re-checked on pop.
+        self._pending_reveals: List[Tuple[float, int]] = []
+        self._event_log: Deque[Tuple[MangoTangoEvent, Tuple[str, ...], Tuple[Any, ...]]] = deque()
         self._royalty_info = RoyaltyInfo(recipient=ROYALTY_RECIPIENT_ADDRESS, bps=MANGO_TANGO_ROYALTY_BPS)
         self._minter_address = MINTER_ADDRESS
         self._treasury_address = TREASURY_ADDRESS
@@ -270,71 +607,67 @@ class MangoTangoMinter:
         return MANGO_TANGO_MAX_SUPPLY
 
     def get_mint_price_wei(self) -> int:
-        if self._phase == MangoTangoPhase.ALLOWLIST:
-            return MANGO_TANGO_MINT_PRICE_WEI
-        if self._phase == MangoTangoPhase.PUBLIC:
-            return MANGO_TANGO_MINT_PRICE_WEI
+        # Every phase quotes the same price, including the ones that do not mint.
         return MANGO_TANGO_MINT_PRICE_WEI
 
     def get_max_per_wallet(self) -> int:
-        if self._phase == MangoTangoPhase.ALLOWLIST:
-            return MANGO_TANGO_ALLOWLIST_PHASE_MAX_PER_WALLET
-        if self._phase == MangoTangoPhase.PUBLIC:
-            return MANGO_TANGO_PUBLIC_PHASE_MAX_PER_WALLET
-        return 0
+        return _MAX_PER_WALLET_BY_PHASE[self._phase]
 
     def add_to_allowlist(self, addresses: List[str]) -> None:
-        for a in addresses:
-            self._allowlist.add(a.strip().lower())
-        self._emit(MangoTangoEvent.ALLOWLIST_UPDATED, {"count": len(addresses)})
+        self._add_normalized_to_allowlist([_norm(a) for a in addresses])
+
+    def _add_normalized_to_allowlist(self, keys: List[str]) -> None:
+        self._allowlist.update(keys)
+        self._emit(MangoTangoEvent.ALLOWLIST_UPDATED, _EVENT_KEYS_COUNT, (len(keys),))
 
     def remove_from_allowlist(self, address: str) -> None:
-        self._allowlist.discard(address.strip().lower())
-        self._emit(MangoTangoEvent.ALLOWLIST_UPDATED, {"removed": address})
+        self._allowlist.discard(_norm(address))
+        self._emit(MangoTangoEvent.ALLOWLIST_UPDATED, _EVENT_KEYS_REMOVED, (address,))
 
     def is_on_allowlist(self, address: str) -> bool:
-        return address.strip().lower() in self._allowlist
+        return self._is_on_allowlist_normalized(_norm(address))
+
+    def _is_on_allowlist_normalized(self, key: str) -> bool:
+        return key in self._allowlist
 
     def get_allowlist_size(self) -> int:
         return len(self._allowlist)
 
-    def _emit(self, event: MangoTangoEvent, data: Dict[str, Any]) -> None:
-        self._event_log.append((event, data))
+    def _emit(self, event: MangoTangoEvent, keys: Tuple[str, ...], values: Tuple[Any, ...]) -> None:
+        # Payload dicts are only built when the log is read.
+        self._event_log.append((event, keys, values))
 
     def can_mint(self, address: str, quantity: int, value_wei: int) -> Tuple[bool, Optional[str]]:
-        if self._phase == MangoTangoPhase.CLOSED:
-            return False, "MangoTango: minting closed"
-        if self._phase == MangoTangoPhase.SOLD_OUT:
-            return False, "MangoTango: sold out"
+        err = self._check_mint(address, _norm(address), quantity, value_wei)[0]
+        return err is None, err
+
+    def _check_mint(self, address: str, key: str, quantity: int, value_wei: int) -> Tuple[Optional[str], Optional[Exception], int]:
+        # Every mint check in one pass: (message, exception mint() raises, current wallet count); message is None when allowed.
+        phase = self._phase
+        if phase == _PHASE_CLOSED:
+            return "MangoTango: minting closed", MangoTangoPhaseClosedError(self._phase), 0
+        if phase == _PHASE_SOLD_OUT:
+            return "MangoTango: sold out", MangoTangoPhaseClosedError(self._phase), 0
         if self._total_minted + quantity > MANGO_TANGO_MAX_SUPPLY:
-            return False, "MangoTango: would exceed max supply"
+            return "MangoTango: would exceed max supply", MangoTangoMintCapReachedError(self._total_minted, MANGO_TANGO_MAX_SUPPLY), 0
         required = self.get_mint_price_wei() * quantity
         if value_wei < required:
-            return False, "MangoTango: insufficient value"
-        current = self._mint_count_per_wallet.get(address.strip().lower(), 0)
+            return "MangoTango: insufficient value", MangoTangoInsufficientValueError(value_wei, required), 0
+        current = self._mint_count_per_wallet.get(key, 0)
         limit = self.get_max_per_wallet()
-        if self._phase == MangoTangoPhase.ALLOWLIST and not self.is_on_allowlist(address):
-            return False, "MangoTango: not on allowlist"
+        if phase == _PHASE_ALLOWLIST and not self._is_on_allowlist_normalized(key):
+            return "MangoTango: not on allowlist", MangoTangoNotAllowedError(address), current
         if current + quantity > limit:
-            return False, "MangoTango: wallet limit exceeded"
-        return True, None
+            return "MangoTango: wallet limit exceeded", MangoTangoWalletLimitError(address, current, limit), current
+        return None, None, current
 
     def mint(self, to_address: str, quantity: int, value_wei: int) -> List[int]:
-        ok, err = self.can_mint(to_address, quantity, value_wei)
-        if not ok:
-            raise MangoTangoMintCapReachedError(self._total_minted, MANGO_TANGO_MAX_SUPPLY) if "exceed" in (err or "") else MangoTangoWalletLimitError(to_address, self._mint_count_per_wallet.get(to_address.lower(), 0), self.get_max_per_wallet())
-        required = self.get_mint_price_wei() * quantity
-        if value_wei < required:
-            raise MangoTangoInsufficientValueError(value_wei, required)
-        if self._phase == MangoTangoPhase.ALLOWLIST and not self.is_on_allowlist(to_address):
-            raise MangoTangoNotAllowedError(to_address)
-
-        key = to_address.strip().lower()
-        current = self._mint_count_per_wallet.get(key, 0)
-        limit = self.get_max_per_wallet()
-        if current + quantity > limit:
-            raise MangoTangoWalletLimitError(to_address, current, limit)
+        key = _norm(to_address)
+        _, error, current = self._check_mint(to_address, key, quantity, value_wei)
+        if error is not None:
+            raise error
 
+        price = self.get_mint_price_wei()
         minted_ids: List[int] = []
         for _ in range(quantity):
             if self._total_minted >= MANGO_TANGO_MAX_SUPPLY:
@@ -343,16 +676,20 @@ class MangoTangoMinter:
             self._next_token_id += 1
             self._total_minted += 1
             self._owner_of[tid] = to_address
-            self._reveal_ready_at[tid] = time.time() + MANGO_TANGO_REVEAL_DELAY_SEC
-            meta = build_token_metadata(tid, revealed=False)
-            self._metadata_store[tid] = meta
+            self._schedule_reveal(tid, time.time() + MANGO_TANGO_REVEAL_DELAY_SEC)
+            self._collection.add(tid)
             minted_ids.append(tid)
-            self._emit(MangoTangoEvent.MINT_REQUESTED, {"tokenId": tid, "to": to_address, "valueWei": self.get_mint_price_wei()})
-
-        self._mint_count_per_wallet[key] = self._mint_count_per_wallet.get(key, 0) + len(minted_ids)
+            self._emit(MangoTangoEvent.MINT_REQUESTED, _EVENT_KEYS_MINT, (tid, to_address, price))
+
+        if minted_ids:
+            # Owners only enter the index once they hold a token, so zero-quantity mints leave no empty entry.
+            self._tokens_by_owner.setdefault(key, set()).update(minted_ids)
+        self._mint_count_per_wallet[key] = current + len(minted_ids)
+        self._fingerprint_cache = None
+        self._tokens_tuple_cache.pop(key, None)
         if self._total_minted >= MANGO_TANGO_MAX_SUPPLY:
             self._phase = MangoTangoPhase.SOLD_OUT
-            self._emit(MangoTangoEvent.PHASE_ADVANCED, {"phase": "SOLD_OUT"})
+            self._emit(MangoTangoEvent.PHASE_ADVANCED, _EVENT_KEYS_PHASE, ("SOLD_OUT",))
         return minted_ids
 
     def owner_of(self, token_id: int) -> str:
@@ -361,46 +698,56 @@ class MangoTangoMinter:
         return self._owner_of[token_id]
 
     def get_metadata(self, token_id: int) -> TokenMetadata:
-        if token_id not in self._metadata_store:
+        if token_id not in self._collection:
             raise MangoTangoInvalidTokenIdError(token_id)
-        return self._metadata_store[token_id]
+        return self._collection.to_metadata(token_id)
 
     def reveal(self, token_id: int) -> TokenMetadata:
-        if token_id not in self._metadata_store:
+        if token_id not in self._collection:
             raise MangoTangoInvalidTokenIdError(token_id)
-        if time.time() < self._reveal_ready_at.get(token_id, 0):
+        now = time.time()
+        if now < self._reveal_ready_at.get(token_id, 0):
             raise MangoTangoRevealNotReadyError(token_id)
-        meta = build_token_metadata(token_id, revealed=True)
-        self._metadata_store[token_id] = meta
-        self._emit(MangoTangoEvent.TOKEN_REVEALED, {"tokenId": token_id})
-        return meta
+        self._collection.mark_revealed(token_id, now)
+        self._emit(MangoTangoEvent.TOKEN_REVEALED, _EVENT_KEYS_TOKEN, (token_id,))
+        return self._collection.to_metadata(token_id)
 
-    def balance_of(self, address: str) -> int:
-        count = 0
-        key = address.strip().lower()
-        for owner in self._owner_of.values():
-            if owner.strip().lower() == key:
-                count += 1
-        return count
+    def _schedule_reveal(self, token_id: int, ready_at: float) -> None:
+        # The only writer of reveal times, so the sweep heap always holds an entry for the current time.
+        self._reveal_ready_at[token_id] = ready_at
+        heapq.heappush(self._pending_reveals, (ready_at, token_id))
 
-    def tokens_of_owner(self, address: str) -> List[int]:
-        key = address.strip().lower()
-        return [tid for tid, owner in self._owner_of.items() if owner.strip().lower() == key]
+    def balance_of(self, address: str) -> int:
+        return len(self._tokens_by_owner.get(_norm(address), ()))
+
+    def tokens_of_owner(self, address: str) -> Tuple[int, ...]:
+        # Shared, immutable result; rebuilt only after the owner mints again.
+        key = _norm(address)
+        cached = self._tokens_tuple_cache.get(key)
+        if cached is None:
+            owned = self._tokens_by_owner.get(key)
+            if owned is None:
+                return ()  # never minted; not cached so lookups of unknown addresses do not grow the cache
+            cached = self._tokens_tuple_cache[key] = tuple(sorted(owned))
+        return cached
 
     def advance_to_public(self) -> None:
         self._phase = MangoTangoPhase.PUBLIC
-        self._emit(MangoTangoEvent.PHASE_ADVANCED, {"phase": "PUBLIC"})
+        self._emit(MangoTangoEvent.PHASE_ADVANCED, _EVENT_KEYS_PHASE, ("PUBLIC",))
 
     def get_royalty_info(self) -> RoyaltyInfo:
         return self._royalty_info
 
     def get_event_log(self) -> List[Tuple[MangoTangoEvent, Dict[str, Any]]]:
-        return list(self._event_log)
+        return [(event, dict(zip(keys, values))) for event, keys, values in self._event_log]
 
     def collection_fingerprint(self) -> str:
-        return hashlib.sha256(
-            f"{MANGO_TANGO_COLLECTION_SEED}-{self._total_minted}-{self._next_token_id}-{MANGO_TANGO_DEPLOY_SALT}".encode()
-        ).hexdigest()[:32]
+        if self._fingerprint_cache is None:
+            self._fingerprint_cache = hashlib.blake2b(
+                f"{MANGO_TANGO_COLLECTION_SEED}-{self._total_minted}-{self._next_token_id}-{MANGO_TANGO_DEPLOY_SALT}".encode(),
+                digest_size=16,
+            ).hexdigest()
+        return self._fingerprint_cache
 
 
 # ---------------------------------------------------------------------------
@@ -437,16 +784,15 @@ def compute_royalty_amount(sale_price_wei: int, bps: int) -> int:
     return (sale_price_wei * bps) // MANGO_TANGO_BPS_DENOM
 
 
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+
 def validate_eth_address(addr: str) -> bool:
     if not addr or len(addr) != 42:
         return False
     if addr[:2] != "0x":
         return False
-    try:
-        int(addr[2:], 16)
-        return True
-    except ValueError:
-        return False
+    return _HEX_CHARS.issuperset(addr[2:])
 
 
 def token_uri_path(token_id: int) -> str:
@@ -496,9 +842,10 @@ class AllowlistManager:
         self._minter = minter
 
     def add_batch(self, addresses: List[str]) -> int:
-        valid = [a for a in addresses if validate_eth_address(a.strip())]
-        self._minter.add_to_allowlist(valid)
-        return len(valid)
+        # Strip once, validate, lowercase: the minter receives keys that need no further normalization.
+        keys = [s.lower() for s in map(str.strip, addresses) if validate_eth_address(s)]
+        self._minter._add_normalized_to_allowlist(keys)
+        return len(keys)
 
     def remove_batch(self, addresses: List[str]) -> int:
         count = 0
@@ -535,14 +882,22 @@ class RevealScheduler:
         return max(0.0, t)
 
     def reveal_all_ready(self) -> List[int]:
+        # Pops only tokens whose reveal time has passed; tokens already revealed directly are skipped.
         revealed = []
-        for tid in list(self._minter._metadata_store.keys()):
-            if self.is_reveal_ready(tid) and not self._minter.get_metadata(tid).revealed:
-                try:
-                    self._minter.reveal(tid)
-                    revealed.append(tid)
-                except MangoTangoRevealNotReadyError:
-                    pass
+        pending = self._minter._pending_reveals
+        ready_at = self._minter._reveal_ready_at
+        now = time.time()
+        while pending and pending[0][0] <= now:
+            _, tid = heapq.heappop(pending)
+            if tid not in ready_at or self._minter._collection.is_revealed(tid):
+                continue
+            if ready_at[tid] > now:
+                continue  # stale entry; _schedule_reveal already pushed one for the later time
+            try:
+                self._minter.reveal(tid)
+                revealed.append(tid)
+            except MangoTangoRevealNotReadyError:
+                pass
         return revealed
 
 
@@ -563,50 +918,75 @@ class MetadataBuilder:
             "name": meta.name,
             "description": meta.description,
             "image": meta.image_uri,
-            "attributes": meta.attributes,
+            "attributes": meta.resolved_attributes,
             "external_url": token_uri_path(token_id),
         }
 
     @staticmethod
-    def rarity_score(attributes: List[Dict[str, Any]]) -> float:
-        weights = get_trait_rarity_weights()
+    def rarity_score(attributes: Union[List[Dict[str, Any]], Tuple[Tuple[int, int], ...]]) -> float:
+        # Accepts resolved dicts or TokenMetadata.attributes id pairs; id pairs index the weight tables directly.
+        # Values outside the base trait tables (including extended traits) score nothing.
+        if attributes and isinstance(attributes[0], tuple):
+            return _rarity_score_of_ids(tuple(attributes))
+        tables = _rarity_score_tables()
         score = 0.0
         for attr in attributes:
-            trait_type = attr.get("trait_type", "")
-            if trait_type in weights:
-                vals = weights[trait_type]
-                idx = min(len(vals) - 1, hash(attr.get("value", "")) % len(vals))
-                score += vals[idx]
+            type_id = _TRAIT_TYPE_IDS.get(attr.get("trait_type", ""))
+            if type_id is None:
+                continue
+            value_id = _TRAIT_VALUE_IDS[type_id].get(attr.get("value", ""))
+            if value_id is not None:
+                score += tables[type_id][value_id]
         return score
 
 
+@functools.lru_cache(maxsize=1)
+def _rarity_score_tables() -> Tuple[Tuple[float, ...], ...]:
+    # Score of every (trait_type_id, value_id); trait types without weights score 0.0.
+    weights = get_trait_rarity_weights()
+    tables = []
+    for name, values in zip(_TRAIT_TYPE_NAMES, _TRAIT_VALUE_TABLES):
+        w = weights.get(name)
+        tables.append(tuple(w[value_id % len(w)] if w else 0.0 for value_id in range(len(values))))
+    return tuple(tables)
+
+
+def _rarity_score_of_ids(attribute_ids: Tuple[Tuple[int, int], ...]) -> float:
+    tables = _rarity_score_tables()
+    return sum(tables[type_id][value_id] for type_id, value_id in attribute_ids)
+
+
+def batch_rarity_scores(token_ids: List[int]) -> List[float]:
+    return [_rarity_score_of_ids(_token_attribute_ids(tid)) for tid in token_ids]
+
+
 # ---------------------------------------------------------------------------
 # Extra trait pools for metadata variety
 # ---------------------------------------------------------------------------
 
-MANGO_TANGO_HAT_STYLES = [
+MANGO_TANGO_HAT_STYLES = (
     "None", "Crown", "Sombrero", "Fedora", "Beanie", "Cap", "Straw", "Top Hat",
-]
+)
 
-MANGO_TANGO_EYE_STYLES = [
+MANGO_TANGO_EYE_STYLES = (
     "Default", "Wink", "Closed", "Star", "Heart", "Sparkle", "Serious", "Happy",
-]
+)
 
-MANGO_TANGO_MOUTH_STYLES = [
+MANGO_TANGO_MOUTH_STYLES = (
     "Smile", "Grin", "Neutral", "Open", "Tongue", "Whistle", "Smirk",
-]
+)
 
-MANGO_TANGO_BACKGROUND_EFFECTS = [
+MANGO_TANGO_BACKGROUND_EFFECTS = (
     "None", "Bokeh", "Gradient", "Pattern", "Stars", "Leaves", "Waves",
-]
+)
 
-MANGO_TANGO_BORDER_STYLES = [
+MANGO_TANGO_BORDER_STYLES = (
     "None", "Gold", "Silver", "Bronze", "Rainbow", "Matte",
-]
+)
 
-MANGO_TANGO_GENERATION_NAMES = [
+MANGO_TANGO_GENERATION_NAMES = (
     "Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta",
-]
+)
 
 MANGO_TANGO_SEASON_IDS = [1, 2, 3, 4, 5, 6]
 
@@ -616,42 +996,67 @@ MANGO_TANGO_ANIMATION_URIS = [
     "ipfs://QmAnim1/", "ipfs://QmAnim2/", "ipfs://QmAnim3/",
 ]
 
+_SEASON_ID_LABELS = tuple(str(s) for s in MANGO_TANGO_SEASON_IDS)
+
+_HAT_N = len(MANGO_TANGO_HAT_STYLES)
+_EYES_N = len(MANGO_TANGO_EYE_STYLES)
+_MOUTH_N = len(MANGO_TANGO_MOUTH_STYLES)
+_BG_EFFECT_N = len(MANGO_TANGO_BACKGROUND_EFFECTS)
+_BORDER_N = len(MANGO_TANGO_BORDER_STYLES)
+_GENERATION_N = len(MANGO_TANGO_GENERATION_NAMES)
+_SEASON_ID_N = len(_SEASON_ID_LABELS)
+
+
+def _hat_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 9, MANGO_TANGO_HAT_STYLES, _HAT_N)
+
 
 def get_hat_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[18:34], MANGO_TANGO_HAT_STYLES)
+    return _hat_from_seed(_token_seed(token_id))
+
+
+def _eyes_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 10, MANGO_TANGO_EYE_STYLES, _EYES_N)
 
 
 def get_eyes_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[20:36], MANGO_TANGO_EYE_STYLES)
+    return _eyes_from_seed(_token_seed(token_id))
+
+
+def _mouth_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 11, MANGO_TANGO_MOUTH_STYLES, _MOUTH_N)
 
 
 def get_mouth_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[22:38], MANGO_TANGO_MOUTH_STYLES)
+    return _mouth_from_seed(_token_seed(token_id))
+
+
+def _background_effect_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 12, MANGO_TANGO_BACKGROUND_EFFECTS, _BG_EFFECT_N)
 
 
 def get_background_effect_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[24:40], MANGO_TANGO_BACKGROUND_EFFECTS)
+    return _background_effect_from_seed(_token_seed(token_id))
+
+
+def _border_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 13, MANGO_TANGO_BORDER_STYLES, _BORDER_N)
 
 
 def get_border_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[26:42], MANGO_TANGO_BORDER_STYLES)
+    return _border_from_seed(_token_seed(token_id))
 
 
 def generate_extended_attributes(token_id: int) -> List[Dict[str, Any]]:
     base = generate_metadata_attributes(token_id, True)
-    base.append({"trait_type": "Hat", "value": get_hat_for_token(token_id)})
-    base.append({"trait_type": "Eyes", "value": get_eyes_for_token(token_id)})
-    base.append({"trait_type": "Mouth", "value": get_mouth_for_token(token_id)})
-    base.append({"trait_type": "Background Effect", "value": get_background_effect_for_token(token_id)})
-    base.append({"trait_type": "Border", "value": get_border_for_token(token_id)})
-    seed = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    base.append({"trait_type": "Generation", "value": _pick_trait_from_hash(seed[28:44], MANGO_TANGO_GENERATION_NAMES)})
-    base.append({"trait_type": "Season ID", "value": _pick_trait_from_hash(seed[30:46], [str(s) for s in MANGO_TANGO_SEASON_IDS])})
+    seed = _token_seed(token_id)
+    base.append({"trait_type": "Hat", "value": _hat_from_seed(seed)})
+    base.append({"trait_type": "Eyes", "value": _eyes_from_seed(seed)})
+    base.append({"trait_type": "Mouth", "value": _mouth_from_seed(seed)})
+    base.append({"trait_type": "Background Effect", "value": _background_effect_from_seed(seed)})
+    base.append({"trait_type": "Border", "value": _border_from_seed(seed)})
+    base.append({"trait_type": "Generation", "value": _pick_trait(seed, 14, MANGO_TANGO_GENERATION_NAMES, _GENERATION_N)})
+    base.append({"trait_type": "Season ID", "value": _pick_trait(seed, 15, _SEASON_ID_LABELS, _SEASON_ID_N)})
     return base
 
 
@@ -748,7 +1153,7 @@ def abi_like_token_uri(minter: MangoTangoMinter, token_id: int) -> Optional[str]
             "name": meta.name,
             "description": meta.description,
             "image": meta.image_uri,
-            "attributes": meta.attributes,
+            "attributes": meta.resolved_attributes,
         })
     except MangoTangoInvalidTokenIdError:
         return None
@@ -767,29 +1172,29 @@ def abi_like_royalty_info(minter: MangoTangoMinter) -> Dict[str, Any]:
 # Additional trait and metadata pools (expand line count)
 # ---------------------------------------------------------------------------
 
-MANGO_TANGO_WEATHER_TRAITS = [
+MANGO_TANGO_WEATHER_TRAITS = (
     "Sunny", "Cloudy", "Rain", "Tropical Storm", "Clear Night", "Dusk", "Dawn",
-]
+)
 
-MANGO_TANGO_FRUIT_ACCENTS = [
+MANGO_TANGO_FRUIT_ACCENTS = (
     "Mango", "Papaya", "Pineapple", "Coconut", "Lime", "Passion", "Guava", "Banana",
-]
+)
 
-MANGO_TANGO_DANCE_STYLES = [
+MANGO_TANGO_DANCE_STYLES = (
     "Tango", "Salsa", "Samba", "Cha-Cha", "Rumba", "Merengue", "Cumbia", "Flamenco",
-]
+)
 
-MANGO_TANGO_MUSIC_GENRES = [
+MANGO_TANGO_MUSIC_GENRES = (
     "Latin", "Tropical", "Reggae", "Calypso", "Bossa", "Jazz", "Folk", "Fusion",
-]
+)
 
-MANGO_TANGO_ISLAND_NAMES = [
+MANGO_TANGO_ISLAND_NAMES = (
     "Tropical Isle", "Mango Bay", "Tango Coast", "Golden Shore", "Citrus Haven",
-]
+)
 
-MANGO_TANGO_PALETTE_NAMES = [
+MANGO_TANGO_PALETTE_NAMES = (
     "Sunset", "Ocean", "Forest", "Desert", "Tropical", "Vintage", "Neon", "Pastel",
-]
+)
 
 MANGO_TANGO_FRAME_COUNT_OPTIONS = [1, 3, 5, 7, 12, 24]
 
@@ -805,45 +1210,71 @@ MANGO_TANGO_GLB_URIS = [
     "ipfs://QmGlb1/", "ipfs://QmGlb2/", "ipfs://QmGlb3/",
 ]
 
+_WEATHER_N = len(MANGO_TANGO_WEATHER_TRAITS)
+_FRUIT_N = len(MANGO_TANGO_FRUIT_ACCENTS)
+_DANCE_N = len(MANGO_TANGO_DANCE_STYLES)
+_MUSIC_N = len(MANGO_TANGO_MUSIC_GENRES)
+_ISLAND_N = len(MANGO_TANGO_ISLAND_NAMES)
+_PALETTE_N = len(MANGO_TANGO_PALETTE_NAMES)
+
+
+def _weather_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 16, MANGO_TANGO_WEATHER_TRAITS, _WEATHER_N)
+
 
 def get_weather_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[32:48], MANGO_TANGO_WEATHER_TRAITS)
+    return _weather_from_seed(_token_seed(token_id))
+
+
+def _fruit_accent_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 17, MANGO_TANGO_FRUIT_ACCENTS, _FRUIT_N)
 
 
 def get_fruit_accent_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[34:50], MANGO_TANGO_FRUIT_ACCENTS)
+    return _fruit_accent_from_seed(_token_seed(token_id))
+
+
+def _dance_style_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 18, MANGO_TANGO_DANCE_STYLES, _DANCE_N)
 
 
 def get_dance_style_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[36:52], MANGO_TANGO_DANCE_STYLES)
+    return _dance_style_from_seed(_token_seed(token_id))
+
+
+def _music_genre_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 19, MANGO_TANGO_MUSIC_GENRES, _MUSIC_N)
 
 
 def get_music_genre_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[38:54], MANGO_TANGO_MUSIC_GENRES)
+    return _music_genre_from_seed(_token_seed(token_id))
+
+
+def _island_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 20, MANGO_TANGO_ISLAND_NAMES, _ISLAND_N)
 
 
 def get_island_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[40:56], MANGO_TANGO_ISLAND_NAMES)
+    return _island_from_seed(_token_seed(token_id))
+
+
+def _palette_from_seed(seed: bytes) -> str:
+    return _pick_trait(seed, 21, MANGO_TANGO_PALETTE_NAMES, _PALETTE_N)
 
 
 def get_palette_for_token(token_id: int) -> str:
-    h = _hash_seed_for_token(MANGO_TANGO_COLLECTION_SEED, token_id)
-    return _pick_trait_from_hash(h[42:58], MANGO_TANGO_PALETTE_NAMES)
+    return _palette_from_seed(_token_seed(token_id))
 
 
 def build_full_extended_metadata(token_id: int) -> Dict[str, Any]:
     attrs = generate_extended_attributes(token_id)
-    attrs.append({"trait_type": "Weather", "value": get_weather_for_token(token_id)})
-    attrs.append({"trait_type": "Fruit Accent", "value": get_fruit_accent_for_token(token_id)})
-    attrs.append({"trait_type": "Dance Style", "value": get_dance_style_for_token(token_id)})
-    attrs.append({"trait_type": "Music Genre", "value": get_music_genre_for_token(token_id)})
-    attrs.append({"trait_type": "Island", "value": get_island_for_token(token_id)})
-    attrs.append({"trait_type": "Palette", "value": get_palette_for_token(token_id)})
+    seed = _token_seed(token_id)
+    attrs.append({"trait_type": "Weather", "value": _weather_from_seed(seed)})
+    attrs.append({"trait_type": "Fruit Accent", "value": _fruit_accent_from_seed(seed)})
+    attrs.append({"trait_type": "Dance Style", "value": _dance_style_from_seed(seed)})
+    attrs.append({"trait_type": "Music Genre", "value": _music_genre_from_seed(seed)})
+    attrs.append({"trait_type": "Island", "value": _island_from_seed(seed)})
+    attrs.append({"trait_type": "Palette", "value": _palette_from_seed(seed)})
     return {
         "token_id": token_id,
         "name": f"{MANGO_TANGO_NAME} #{token_id}",
@@ -875,15 +1306,14 @@ def collection_info() -> Dict[str, Any]:
 def phase_info(phase: MangoTangoPhase) -> Dict[str, Any]:
     return {
         "phase": phase.name,
-        "maxPerWallet": MANGO_TANGO_ALLOWLIST_PHASE_MAX_PER_WALLET if phase == MangoTangoPhase.ALLOWLIST else (MANGO_TANGO_PUBLIC_PHASE_MAX_PER_WALLET if phase == MangoTangoPhase.PUBLIC else 0),
+        "maxPerWallet": _MAX_PER_WALLET_BY_PHASE[phase],
         "mintPriceWei": MANGO_TANGO_MINT_PRICE_WEI,
-        "open": phase in (MangoTangoPhase.ALLOWLIST, MangoTangoPhase.PUBLIC),
+        "open": _MINT_RULES_BY_PHASE[phase] is not None,
     }
 
 
 def wallet_mint_allowance(minter: MangoTangoMinter, address: str) -> Dict[str, Any]:
-    key = address.strip().lower()
-    current = minter._mint_count_per_wallet.get(key, 0)
+    current = minter._mint_count_per_wallet.get(_norm(address), 0)
     limit = minter.get_max_per_wallet()
     return {
         "address": address,
@@ -926,11 +1356,13 @@ def chunk_token_ids(token_ids: List[int], chunk_size: int) -> List[List[int]]:
 
 
 def filter_revealed(minter: MangoTangoMinter, token_ids: List[int]) -> List[int]:
-    return [tid for tid in token_ids if tid in minter._metadata_store and minter._metadata_store[tid].revealed]
+    collection = minter._collection
+    return [tid for tid in token_ids if collection.is_revealed(tid)]
 
 
 def filter_unrevealed(minter: MangoTangoMinter, token_ids: List[int]) -> List[int]:
-    return [tid for tid in token_ids if tid in minter._metadata_store and not minter._metadata_store[tid].revealed]
+    collection = minter._collection
+    return [tid for tid in token_ids if tid in collection and not collection.is_revealed(tid)]
 
 
 # ---------------------------------------------------------------------------
@@ -955,7 +1387,7 @@ def total_mint_cost_ether(quantity: int) -> float:
 # ---------------------------------------------------------------------------
 
 def filter_events_by_type(minter: MangoTangoMinter, event_type: MangoTangoEvent) -> List[Dict[str, Any]]:
-    return [data for ev, data in minter.get_event_log() if ev == event_type]
+    return [dict(zip(keys, values)) for ev, keys, values in minter._event_log if ev == event_type]
 
 
 def filter_mint_events(minter: MangoTangoMinter) -> List[Dict[str, Any]]:
@@ -974,14 +1406,12 @@ def address_checksum(addr: str) -> str:
     s = addr.strip().lower()
     if len(s) != 42 or not s.startswith("0x"):
         return addr
-    h = hashlib.sha256(s.encode()).hexdigest()
-    out = "0x"
-    for i, c in enumerate(s[2:]):
-        if int(h[i], 16) >= 8:
-            out += c.upper()
-        else:
-            out += c
-    return out
+    # Nibble i of the digest is >= 8 exactly when its top bit is set: 0x80 for even i, 0x08 for odd i.
+    d = hashlib.sha256(s.encode()).digest()
+    return "0x" + "".join(
+        c.upper() if d[i >> 1] & (0x08 if i & 1 else 0x80) else c
+        for i, c in enumerate(s[2:])
+    )
 
 
 def verify_collection_fingerprint(minter: MangoTangoMinter, expected_prefix: str) -> bool: